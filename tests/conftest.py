@@ -0,0 +1,91 @@
+import os
+import sys
+import types
+
+import pytest
+
+# Make the top-level scripts importable from the tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        "display: needs a Tk display; run headless with `xvfb-run python -m pytest`"
+    )
+
+
+class FakeYoutubeDL:
+    # Stand-in for yt_dlp.YoutubeDL; class attributes are reset per test
+    playlists = {}  # URL -> playlist info with a list of entry ids, or None for a failed extraction
+    failing = set()  # URLs whose download fails
+    pulled = []  # Entry ids in the order they were enumerated
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def extract_info(self, url, download=False, process=True):
+        if url in self.playlists:
+            playlist = self.playlists[url]
+            if playlist is None:
+                return None
+            info = dict(playlist)
+            info['entries'] = self.iter_entries(playlist['entries'])
+            return info
+
+        # Roughly the shape and size of a real extract_info result
+        return {
+            'id': url.rsplit('=', 1)[-1],
+            'title': f"Video {url}",
+            'duration': 600,
+            'thumbnail': f"{url}/thumbnail.jpg",
+            'webpage_url': url,
+            'description': "x" * 5000,
+            'formats': [
+                {
+                    'format_id': str(n),
+                    'format_note': f"{n}p",
+                    'ext': 'mp4',
+                    'resolution': f"{n * 16}x{n * 9}",
+                    'vcodec': 'avc1',
+                    'acodec': 'mp4a',
+                    'url': f"{url}/format/{n}?" + "sig" * 200,
+                    'http_headers': {'User-Agent': "agent" * 20},
+                }
+                for n in range(60)
+            ],
+        }
+
+    def iter_entries(self, ids):
+        for video_id in ids:
+            self.pulled.append(video_id)
+            yield {'id': video_id, 'url': f"https://example.com/watch?v={video_id}"}
+
+    def download(self, urls):
+        return 1 if any(url in self.failing for url in urls) else 0
+
+
+@pytest.fixture
+def fake_yt_dlp(monkeypatch):
+    monkeypatch.setattr(FakeYoutubeDL, 'playlists', {})
+    monkeypatch.setattr(FakeYoutubeDL, 'failing', set())
+    monkeypatch.setattr(FakeYoutubeDL, 'pulled', [])
+    monkeypatch.setitem(sys.modules, 'yt_dlp', types.SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+    return FakeYoutubeDL
+
+
+def rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        resource = pytest.importorskip('resource')
+        # ru_maxrss is the peak RSS, in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
@@ -0,0 +1,85 @@
+import pytest
+
+import video_downloader_gui
+from conftest import rss_bytes
+
+ITERATIONS = 3000
+WARMUP_ITERATIONS = 1000
+# Allowed RSS growth once the caps are full
+MAX_RSS_GROWTH = 10 * 1024 * 1024
+
+
+def test_bookkeeping_memory_is_bounded(fake_yt_dlp):
+    info_cache = video_downloader_gui.InfoCache(max_bytes=1024 * 1024)
+    history = video_downloader_gui.DownloadHistory(max_items=500)
+
+    def run(start, count):
+        for i in range(start, start + count):
+            url = f"https://example.com/watch?v={i}"
+            info_cache.put(url, video_downloader_gui.fetch_video_info(url, {}))
+            history.add(url, 'best', "Completed")
+
+    run(0, WARMUP_ITERATIONS)
+    rss_after_warmup = rss_bytes()
+    run(WARMUP_ITERATIONS, ITERATIONS - WARMUP_ITERATIONS)
+
+    assert info_cache.size <= info_cache.max_bytes
+    assert len(info_cache) < ITERATIONS
+    assert len(history) == 500
+    assert history.is_downloaded(f"https://example.com/watch?v={ITERATIONS - 1}", 'best')
+    assert not history.is_downloaded("https://example.com/watch?v=0", 'best')
+    assert rss_bytes() - rss_after_warmup < MAX_RSS_GROWTH
+
+
+@pytest.fixture
+def app(fake_yt_dlp, monkeypatch):
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display available for Tk; run under xvfb-run")
+    root.withdraw()
+    app = video_downloader_gui.VideoDownloaderGUI(root)
+    # Keep the preview window and dialogs out of the way
+    monkeypatch.setattr(app, 'show_preview_window', lambda video_info: None)
+    monkeypatch.setattr(video_downloader_gui.messagebox, 'showerror', lambda *args: None)
+    yield app
+    root.destroy()
+
+
+def run_session(app, start, count):
+    import tkinter as tk
+
+    for i in range(start, start + count):
+        url = f"https://example.com/watch?v={i}"
+        app.urls_text.delete(1.0, tk.END)
+        app.urls_text.insert(tk.END, url)
+        app.fetch_formats()
+        app.close_preview_window()
+
+        progress = video_downloader_gui.DownloadProgress(url, 'best', app.scrollable_frame)
+        progress.parent = app
+        app.active_downloads[url] = progress
+        app.process_download(url, 'best', progress)
+        # Pausing and resuming a finished row must not keep it from being compacted
+        progress.toggle_pause()
+        progress.toggle_pause()
+
+        if i % 50 == 0:
+            app.root.update()
+    app.root.update()
+
+
+@pytest.mark.display
+def test_long_session_memory_is_bounded(app):
+    run_session(app, 0, WARMUP_ITERATIONS)
+    rss_after_warmup = rss_bytes()
+
+    run_session(app, WARMUP_ITERATIONS, ITERATIONS - WARMUP_ITERATIONS)
+
+    assert len(app.active_downloads) <= app.max_completed_shown
+    assert len(app.completed_downloads) <= app.completed_downloads.max_items
+    assert app.info_cache.size <= app.info_cache.max_bytes
+    assert len(app.info_cache) < ITERATIONS
+    assert rss_bytes() - rss_after_warmup < MAX_RSS_GROWTH
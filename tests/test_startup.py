@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time allowed for both entry points, in microseconds
+IMPORT_BUDGET_US = 150_000
+
+HEAVY_MODULES = ['yt_dlp', 'PIL', 'requests']
+
+
+def run_import(code):
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_DIR, capture_output=True, text=True, check=True
+    )
+
+
+def test_heavy_modules_not_imported_at_startup():
+    result = run_import(
+        "import sys, video_downloader, video_downloader_gui\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ''
+
+
+def test_import_time_budget():
+    result = run_import("import video_downloader, video_downloader_gui")
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        fields = [field.strip() for field in line[len('import time:'):].split('|')]
+        if fields[1].isdigit():
+            cumulative[fields[2]] = int(fields[1])
+
+    total = cumulative['video_downloader'] + cumulative['video_downloader_gui']
+    assert total < IMPORT_BUDGET_US, f"Import took {total} us, budget is {IMPORT_BUDGET_US} us"
@@ -0,0 +1,98 @@
+import types
+
+import pytest
+
+import video_downloader
+from conftest import FakeYoutubeDL
+
+
+@pytest.fixture
+def sync(fake_yt_dlp, monkeypatch, tmp_path):
+    state_path = str(tmp_path / 'sync.json')
+    monkeypatch.setattr(video_downloader.save_sync_state, '__defaults__', (state_path,))
+    monkeypatch.setattr(video_downloader.load_sync_state, '__defaults__', (state_path,))
+
+    downloads = []
+    failing = set()
+
+    def fake_download(url, format_id='best'):
+        downloads.append(url.rsplit('=', 1)[1])
+        return url.rsplit('=', 1)[1] not in failing
+
+    monkeypatch.setattr(video_downloader, 'download_video', fake_download)
+    return types.SimpleNamespace(downloads=downloads, failing=failing)
+
+
+def test_channel_stops_at_first_seen_id(sync):
+    channel = {'_type': 'playlist', 'id': 'UC1', 'channel_id': 'UC1', 'entries': ['c', 'b', 'a']}
+    FakeYoutubeDL.playlists['chan'] = channel
+    assert video_downloader.sync_playlists(['chan'])
+    assert sync.downloads == ['a', 'b', 'c']
+
+    channel['entries'] = ['e', 'd', 'c', 'b', 'a']
+    sync.downloads.clear()
+    FakeYoutubeDL.pulled.clear()
+    assert video_downloader.sync_playlists(['chan'])
+    assert sync.downloads == ['d', 'e']
+    assert FakeYoutubeDL.pulled == ['e', 'd', 'c']
+
+
+def test_playlist_finds_items_appended_at_the_end(sync):
+    playlist = {'_type': 'playlist', 'id': 'PL1', 'channel_id': 'UC1', 'entries': ['a', 'b']}
+    FakeYoutubeDL.playlists['list'] = playlist
+    video_downloader.sync_playlists(['list'])
+
+    playlist['entries'] = ['a', 'b', 'c']
+    sync.downloads.clear()
+    video_downloader.sync_playlists(['list'])
+    assert sync.downloads == ['c']
+
+
+def test_failed_downloads_are_retried(sync):
+    FakeYoutubeDL.playlists['chan'] = {'_type': 'playlist', 'id': 'UC1', 'channel_id': 'UC1', 'entries': ['b', 'a']}
+    sync.failing.add('a')
+    assert not video_downloader.sync_playlists(['chan'])
+    assert 'a' in video_downloader.load_sync_state()['chan']['failed']
+
+    sync.failing.clear()
+    sync.downloads.clear()
+    assert video_downloader.sync_playlists(['chan'])
+    assert sync.downloads == ['a']
+    assert video_downloader.load_sync_state()['chan']['failed'] == {}
+
+
+def test_mark_seen_skips_existing_videos(sync):
+    FakeYoutubeDL.playlists['chan'] = {'_type': 'playlist', 'id': 'UC1', 'channel_id': 'UC1', 'entries': ['b', 'a']}
+    assert video_downloader.sync_playlists(['chan'], mark_only=True)
+    assert video_downloader.sync_playlists(['chan'])
+    assert sync.downloads == []
+
+
+def test_failed_extraction_is_reported(sync):
+    FakeYoutubeDL.playlists['chan'] = {'_type': 'playlist', 'id': 'UC1', 'channel_id': 'UC1', 'entries': ['a']}
+    assert video_downloader.sync_playlists(['chan'])
+
+    FakeYoutubeDL.playlists['chan'] = None
+    assert not video_downloader.sync_playlists(['chan'])
+    assert video_downloader.load_sync_state()['chan']['newest_first']
+
+
+def test_gives_up_after_max_attempts(sync):
+    FakeYoutubeDL.playlists['chan'] = {'_type': 'playlist', 'id': 'UC1', 'channel_id': 'UC1', 'entries': ['a']}
+    sync.failing.add('a')
+    for _ in range(video_downloader.MAX_FAILED_ATTEMPTS - 1):
+        assert not video_downloader.sync_playlists(['chan'])
+
+    # The last attempt gives up on the video instead of failing the run
+    assert video_downloader.sync_playlists(['chan'])
+    sync.downloads.clear()
+    assert video_downloader.sync_playlists(['chan'])
+    assert sync.downloads == []
+    assert video_downloader.load_sync_state()['chan']['failed'] == {}
+
+
+def test_single_video_uses_its_own_url(sync, monkeypatch):
+    urls = []
+    monkeypatch.setattr(video_downloader, 'download_video', lambda url, format_id='best': urls.append(url) or True)
+    assert video_downloader.sync_playlists(['https://example.org/video/42'])
+    assert urls == ['https://example.org/video/42']
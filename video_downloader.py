@@ -1,7 +1,14 @@
 import sys
-import yt_dlp
+import os
+import json
+import time
+
+# yt_dlp is imported inside the functions that use it so that a usage check
+# (or any run that fails early) doesn't pay its import cost.
 
 def list_formats(url):
+    import yt_dlp
+
     ydl_opts = {
         'quiet': True,
         'no_warnings': True
@@ -28,6 +35,8 @@ def list_formats(url):
             return False
 
 def download_video(url, format_id='best'):
+    import yt_dlp
+
     def progress_hook(d):
         if d['status'] == 'downloading':
             try:
@@ -69,10 +78,13 @@ def download_video(url, format_id='best'):
     
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
+            # With ignoreerrors set, failures show up in the return code
+            # instead of an exception
+            return ydl.download([url]) == 0
     except Exception as e:
         print(f"\nError during download: {str(e)}")
         print("Try downloading in a different format or check your internet connection.")
+        return False
 
 def download_multiple_videos(urls, format_id='best'):
     total_videos = len(urls)
@@ -88,8 +100,10 @@ def download_multiple_videos(urls, format_id='best'):
         try:
             print(f"\nProcessing video {index} of {total_videos}")
             print(f"URL: {url}")
-            download_video(url, format_id)
-            successful += 1
+            if download_video(url, format_id):
+                successful += 1
+            else:
+                failed += 1
         except Exception as e:
             print(f"\nFailed to download video {index}: {str(e)}")
             failed += 1
@@ -101,10 +115,197 @@ def download_multiple_videos(urls, format_id='best'):
     print(f"Successfully downloaded: {successful}")
     print(f"Failed: {failed}")
 
+SYNC_STATE_FILE = os.path.expanduser("~/.video_downloader_sync.json")
+MAX_SEEN_IDS = 1000  # Ids remembered per newest-first feed (channel tabs)
+MAX_FAILED_ATTEMPTS = 3  # Downloads tried this many times are skipped for good
+
+def load_sync_state(path=SYNC_STATE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Could not read sync state ({str(e)}), starting fresh.")
+        return {}
+
+def save_sync_state(state, path=SYNC_STATE_FILE):
+    # Write to a temp file first so an interrupted run can't corrupt the state
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(state, file, indent=2)
+    os.replace(tmp_path, path)
+
+def fetch_new_entries(playlist_url, seen_ids):
+    # Returns (new_entries, newest_first), with new_entries oldest first
+    import yt_dlp
+
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'ignoreerrors': True
+    }
+
+    new_entries = []
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        # process=False leaves the entries unresolved, so paginated playlists
+        # are only fetched page by page as we iterate over them
+        info = ydl.extract_info(playlist_url, download=False, process=False)
+        # Channel URLs can redirect to their videos tab first
+        while info and info.get('_type') in ('url', 'url_transparent'):
+            info = ydl.extract_info(info['url'], download=False, process=False)
+        if not info:
+            # ignoreerrors turns a failed extraction into None rather than an exception
+            raise Exception(f"Could not extract {playlist_url}")
+
+        if info.get('_type') != 'playlist':
+            # Single video, treat it as a one-entry playlist
+            entries = [dict(info, webpage_url=info.get('webpage_url') or playlist_url)]
+            newest_first = False
+        else:
+            entries = info.get('entries') or []
+            # Channel tabs carry the channel's own id and list uploads newest
+            # first; ordinary playlists list them oldest first and append
+            newest_first = bool(info.get('id')) and info.get('id') == info.get('channel_id')
+
+        for entry in entries:
+            if not entry or not entry.get('id') or not entry_url(entry):
+                continue
+            if entry['id'] in seen_ids:
+                if newest_first:
+                    # Everything after a known id has been seen already
+                    break
+                # Ordinary playlists have to be scanned to the end; the flat
+                # entries aren't resolved, so this stays cheap
+                continue
+            new_entries.append(entry)
+
+    if newest_first:
+        new_entries.reverse()
+    return new_entries, newest_first
+
+def entry_url(entry):
+    return entry.get('webpage_url') or entry.get('original_url') or entry.get('url')
+
+def mark_seen(playlist_state, video_id):
+    seen_ids = playlist_state['seen_ids']
+    if playlist_state.get('newest_first'):
+        # Only the latest ids are needed to find where the new uploads stop
+        seen_ids.insert(0, video_id)
+        del seen_ids[MAX_SEEN_IDS:]
+    else:
+        # Every id is kept, otherwise older playlist items would be fetched again
+        seen_ids.append(video_id)
+
+def sync_playlist(playlist_url, state, format_id='best', mark_only=False):
+    # Returns (downloaded, failed) for this playlist
+    playlist_state = state.setdefault(playlist_url, {'seen_ids': [], 'failed': {}})
+    failed = playlist_state.setdefault('failed', {})
+
+    print(f"\nSyncing {playlist_url}")
+    try:
+        new_entries, newest_first = fetch_new_entries(playlist_url, set(playlist_state['seen_ids']))
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return 0, 1
+    playlist_state['newest_first'] = newest_first
+
+    if mark_only:
+        for entry in new_entries:
+            mark_seen(playlist_state, entry['id'])
+            failed.pop(entry['id'], None)
+        print(f"Marked {len(new_entries)} videos as seen.")
+        playlist_state['last_sync'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        save_sync_state(state)
+        return 0, 0
+
+    # Retry earlier failures first, then the new entries
+    to_download = [(video_id, record['url']) for video_id, record in failed.items()]
+    retry_count = len(to_download)
+    to_download += [(entry['id'], entry_url(entry)) for entry in new_entries if entry['id'] not in failed]
+
+    if not to_download:
+        print("No new videos.")
+        playlist_state['last_sync'] = time.strftime('%Y-%m-%d %H:%M:%S')
+        save_sync_state(state)
+        return 0, 0
+
+    print(f"Found {len(to_download) - retry_count} new videos, retrying {retry_count} failed ones.")
+    downloaded = 0
+    failures = 0
+    for video_id, video_url in to_download:
+        print(f"URL: {video_url}")
+        if download_video(video_url, format_id):
+            mark_seen(playlist_state, video_id)
+            failed.pop(video_id, None)
+            downloaded += 1
+        else:
+            record = failed.setdefault(video_id, {'url': video_url, 'attempts': 0})
+            record['attempts'] += 1
+            if record['attempts'] >= MAX_FAILED_ATTEMPTS:
+                # Deleted, private or members-only videos never succeed; stop
+                # retrying them so they don't fail every later sync
+                print(f"Giving up on {video_url} after {record['attempts']} attempts.")
+                mark_seen(playlist_state, video_id)
+                del failed[video_id]
+            else:
+                # Not marked as seen, so it is retried on the next sync
+                failures += 1
+        save_sync_state(state)
+        print("-" * 80)
+
+    playlist_state['last_sync'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    save_sync_state(state)
+    return downloaded, failures
+
+def sync_playlists(playlist_urls, format_id='best', interval=None, mark_only=False):
+    # Returns True if the last pass had no failures
+    while True:
+        state = load_sync_state()
+        total_downloaded = 0
+        total_failed = 0
+        for playlist_url in playlist_urls:
+            downloaded, failed = sync_playlist(playlist_url, state, format_id, mark_only)
+            total_downloaded += downloaded
+            total_failed += failed
+
+        print(f"\nSync Summary:")
+        print(f"Playlists checked: {len(playlist_urls)}")
+        print(f"Downloaded: {total_downloaded}")
+        print(f"Failed: {total_failed}")
+
+        if not interval:
+            return total_failed == 0
+        print(f"Next sync in {interval} minutes...")
+        time.sleep(interval * 60)
+
+def sync_main(args):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="video_downloader.py --sync",
+        description="Download only the videos added to playlists/channels since the last sync. "
+                    "The first sync of a playlist downloads all of it unless --mark-seen is given."
+    )
+    parser.add_argument('urls', nargs='+', help="Playlist or channel URLs")
+    parser.add_argument('--format', default='best', help="Format ID to download (default: best)")
+    parser.add_argument('--interval', type=float, help="Repeat the sync every N minutes instead of running once")
+    parser.add_argument('--mark-seen', action='store_true',
+                        help="Record the current videos as seen without downloading them")
+    options = parser.parse_args(args)
+
+    return sync_playlists(options.urls, options.format, options.interval, options.mark_seen)
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python video_downloader.py [URL1] [URL2] ...")
+        print("       python video_downloader.py --sync [PLAYLIST_URL1] ... [--format ID] [--interval MINUTES] [--mark-seen]")
+        print("       (the first --sync of a playlist downloads all of it; use --mark-seen to skip its existing videos)")
         sys.exit(1)
+
+    if sys.argv[1] == '--sync':
+        sys.exit(0 if sync_main(sys.argv[2:]) else 1)
     
     urls = sys.argv[1:]  # Get all URLs from command line arguments
     format_id = input("\nEnter the Format ID you want to download (or press Enter for best quality): ").strip()
@@ -1,16 +1,130 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
-import yt_dlp
 from threading import Thread, Lock
 import os
-from PIL import Image, ImageTk
-import requests
-from io import BytesIO
+import sys
 import json
-from queue import Queue
+from queue import Queue, Empty
+from collections import OrderedDict
 import time
 import threading
 
+# yt_dlp, PIL and requests are slow to import, so they are imported where
+# they're used. The window comes up first and prewarm_imports() loads them
+# in the background so the first "Get Formats" click doesn't wait on them.
+def prewarm_imports():
+    try:
+        import yt_dlp
+        import requests
+        from PIL import Image, ImageTk
+    except ImportError as e:
+        print(f"Failed to preload modules: {e}")
+
+def summarize_formats(formats):
+    # Reduce yt-dlp's format dicts to the (label, format_id) pairs the preview needs
+    format_options = []
+    for f in formats:
+        # Get format details
+        format_note = f.get('format_note', '')
+        ext = f.get('ext', '')
+        resolution = f.get('resolution', '')
+        vcodec = f.get('vcodec', 'none')
+        acodec = f.get('acodec', 'none')
+
+        # Create a more detailed format string
+        format_str = f"{format_note} - {ext} ({resolution})"
+        if vcodec != 'none':
+            format_str += f" [Video: {vcodec}]"
+        if acodec != 'none':
+            format_str += f" [Audio: {acodec}]"
+
+        format_options.append((format_str, f['format_id']))
+    return format_options
+
+def estimate_info_size(compact_info):
+    # Rough size in bytes of a compacted info dict, used for the cache cap
+    size = sys.getsizeof(compact_info) + sys.getsizeof(compact_info['format_options'])
+    for key in ('title', 'thumbnail'):
+        size += sys.getsizeof(compact_info[key])
+    for format_str, format_id in compact_info['format_options']:
+        size += sys.getsizeof(format_str) + sys.getsizeof(format_id) + 56  # 56 for the tuple itself
+    return size
+
+class CompletedDownload:
+    # Slim record kept for a finished download once its widgets are gone
+    __slots__ = ('url', 'format_id', 'status')
+
+    def __init__(self, url, format_id, status):
+        self.url = url
+        self.format_id = format_id
+        self.status = status
+
+class DownloadHistory:
+    # Records of finished downloads, keyed by (url, format_id); oldest dropped first
+    def __init__(self, max_items):
+        self.records = OrderedDict()
+        self.max_items = max_items
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, url, format_id, status):
+        key = (url, format_id)
+        self.records[key] = CompletedDownload(url, format_id, status)
+        self.records.move_to_end(key)
+        while len(self.records) > self.max_items:
+            self.records.popitem(last=False)
+
+    def is_downloaded(self, url, format_id):
+        record = self.records.get((url, format_id))
+        return record is not None and record.status == "Completed"
+
+    def discard(self, url):
+        for key in [key for key in self.records if key[0] == url]:
+            del self.records[key]
+
+    def clear(self):
+        self.records.clear()
+
+class InfoCache:
+    # Compacted video infos, least recently used evicted once over max_bytes
+    def __init__(self, max_bytes):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.max_bytes = max_bytes
+
+    def __contains__(self, url):
+        return url in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, url):
+        self.entries.move_to_end(url)
+        return self.entries[url]
+
+    def put(self, url, compact_info):
+        if url in self.entries:
+            self.size -= estimate_info_size(self.entries.pop(url))
+        self.entries[url] = compact_info
+        self.size += estimate_info_size(compact_info)
+        while self.size > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= estimate_info_size(evicted)
+
+def fetch_video_info(url, ydl_opts):
+    import yt_dlp
+
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+    # Only this compacted copy is kept; the full info dict is dropped here
+    return {
+        'title': info.get('title', 'Unknown'),
+        'duration': info.get('duration', 0),
+        'thumbnail': info.get('thumbnail', ''),
+        'format_options': summarize_formats(info.get('formats', []))
+    }
+
 class DownloadProgress:
     def __init__(self, url, format_id, parent):
         self.url = url
@@ -21,6 +135,7 @@ class DownloadProgress:
         self.eta = "Unknown"
         self.lock = Lock()
         self.paused = False
+        self.result = None  # "Completed" or "Failed" once a worker is done with it
         
         # Create progress frame
         self.frame = ttk.Frame(parent)
@@ -146,16 +261,23 @@ class VideoDownloaderGUI:
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        self.formats = []
+        self.format_options = []
         self.downloading = False
         self.preview_window = None
         self.preview_image = None
         self.download_queue = Queue()
         self.active_downloads = {}
         self.max_concurrent_downloads = 3  # Maximum number of concurrent downloads
-        self.video_info = None
         self.thumbnail_loaded = False
 
+        # Bounded history so the GUI doesn't grow when left running for days
+        self.completed_downloads = DownloadHistory(max_items=500)
+        self.max_completed_shown = 20  # Finished downloads left visible in the list
+        self.info_cache = InfoCache(max_bytes=1024 * 1024)  # Compacted infos for "Get Formats"
+
+        # Load the heavy modules once the window has been drawn
+        self.root.after(0, lambda: Thread(target=prewarm_imports, daemon=True).start())
+
     def show_preview_window(self, video_info):
         if self.preview_window:
             self.preview_window.destroy()
@@ -163,6 +285,7 @@ class VideoDownloaderGUI:
         self.preview_window = tk.Toplevel(self.root)
         self.preview_window.title("Video Preview")
         self.preview_window.geometry("400x500")
+        self.preview_window.protocol("WM_DELETE_WINDOW", self.close_preview_window)
         
         # Create loading frame
         loading_frame = ttk.Frame(self.preview_window)
@@ -180,25 +303,8 @@ class VideoDownloaderGUI:
 
     def load_video_info(self, video_info, loading_frame):
         try:
-            # Create format options
-            format_options = []
-            for f in self.formats:
-                # Get format details
-                format_note = f.get('format_note', '')
-                ext = f.get('ext', '')
-                resolution = f.get('resolution', '')
-                vcodec = f.get('vcodec', 'none')
-                acodec = f.get('acodec', 'none')
-                
-                # Create a more detailed format string
-                format_str = f"{format_note} - {ext} ({resolution})"
-                if vcodec != 'none':
-                    format_str += f" [Video: {vcodec}]"
-                if acodec != 'none':
-                    format_str += f" [Audio: {acodec}]"
-                
-                format_options.append((format_str, f['format_id']))
-            
+            format_options = list(self.format_options)
+
             # Update UI in main thread
             self.root.after(0, lambda: self.update_preview_info(video_info, format_options, loading_frame))
         except Exception as e:
@@ -206,6 +312,10 @@ class VideoDownloaderGUI:
 
     def load_thumbnail(self, thumbnail_url, loading_frame):
         try:
+            import requests
+            from io import BytesIO
+            from PIL import Image, ImageTk
+
             response = requests.get(thumbnail_url)
             img_data = Image.open(BytesIO(response.content))
             img_data = img_data.resize((360, 240), Image.Resampling.LANCZOS)
@@ -257,6 +367,15 @@ class VideoDownloaderGUI:
                     widget.configure(image=self.preview_image)
                     break
 
+    def close_preview_window(self):
+        if self.preview_window:
+            self.preview_window.destroy()
+            self.preview_window = None
+        # Let the thumbnail and format list be collected
+        self.preview_image = None
+        self.thumbnail_loaded = False
+        self.format_options = []
+
     def add_to_queue(self, format_id):
         if not format_id:
             messagebox.showwarning("Warning", "Please select a format")
@@ -270,9 +389,12 @@ class VideoDownloaderGUI:
             return
         
         # Add all URLs to queue
+        already_downloaded = 0
         for url in urls_to_queue:
+            if self.completed_downloads.is_downloaded(url, format_id):
+                already_downloaded += 1
             # Only add if not already in active_downloads (prevents duplicates if add_to_queue is called multiple times)
-            if url not in self.active_downloads:
+            elif url not in self.active_downloads:
                 self.download_queue.put((url, format_id))
                 progress = DownloadProgress(url, format_id, self.scrollable_frame)
                 progress.parent = self  # Add reference to parent for removal
@@ -281,7 +403,11 @@ class VideoDownloaderGUI:
                  print(f"Skipping {url} as it is already in the download list.") # Optional: provide feedback if skipping
         
         self.update_queue_status()
-        self.preview_window.destroy()
+        self.close_preview_window()
+
+        if already_downloaded:
+            messagebox.showinfo("Already Downloaded",
+                f"Skipped {already_downloaded} video(s) already downloaded in this format.")
         
         # Start download workers if not already running or if queue has items
         if not self.downloading or self.download_queue.qsize() > 0:
@@ -292,7 +418,7 @@ class VideoDownloaderGUI:
         
         def download_worker():
             # Workers continue as long as there are items in the queue or active downloads
-            while not self.download_queue.empty() or any(d.status in ["Pending", "Downloading"] for d in self.active_downloads.values()):
+            while not self.download_queue.empty() or any(d.result is None for d in list(self.active_downloads.values())):
                 try:
                     # Use get_nowait() to avoid blocking if the queue is temporarily empty but downloads are still active
                     # Added a timeout to get_nowait to prevent excessive CPU usage in the loop condition check
@@ -312,22 +438,10 @@ class VideoDownloaderGUI:
                          time.sleep(1) # Wait a bit before checking again
                          continue # Go to the next iteration to get another item
                          
-                    progress.update(0, "Downloading")
-                    
-                    try:
-                        self.download_single_video(url, format_id, progress)
-                        if progress.frame.winfo_exists():
-                            # Only update if the frame still exists (wasn't removed during download)
-                            progress.update(100, "Completed")
-                    except Exception as e:
-                        print(f"Error downloading {url}: {e}") # Log the error
-                        if progress.frame.winfo_exists():
-                             # Only update if the frame still exists
-                            progress.update(0, f"Failed: {str(e)}")
-                            
+                    self.process_download(url, format_id, progress)
                     self.download_queue.task_done()
                     self.update_queue_status()
-                except Queue.Empty:
+                except Empty:
                     # If the queue is empty, but there are still active downloads, wait a bit
                     # This prevents the worker from exiting prematurely if downloads are slow
                     time.sleep(0.5) # Reduced sleep time slightly
@@ -350,7 +464,51 @@ class VideoDownloaderGUI:
              thread.start()
              active_worker_threads.append(thread) # Add the new thread to the list
 
+    def process_download(self, url, format_id, progress):
+        progress.update(0, "Downloading")
+
+        try:
+            self.download_single_video(url, format_id, progress)
+            progress.result = "Completed"
+            if progress.frame.winfo_exists():
+                # Only update if the frame still exists (wasn't removed during download)
+                progress.update(100, "Completed")
+        except Exception as e:
+            print(f"Error downloading {url}: {e}") # Log the error
+            progress.result = "Failed"
+            if progress.frame.winfo_exists():
+                 # Only update if the frame still exists
+                progress.update(0, f"Failed: {str(e)}")
+
+        self.root.after(0, lambda: self.compact_download(url, progress))
+
+    def compact_download(self, url, progress):
+        # Swap a finished DownloadProgress for a slim record
+        if self.active_downloads.get(url) is not progress:
+            return
+        self.completed_downloads.add(url, progress.format_id, progress.result)
+
+        # Keep the most recent finished items on screen, drop the widgets of older ones.
+        # result is set by the worker, unlike status which pause/resume can change.
+        finished = [u for u, d in self.active_downloads.items() if d.result is not None]
+        for old_url in finished[:-self.max_completed_shown or None]:
+            old = self.active_downloads.pop(old_url)
+            if old.frame.winfo_exists():
+                old.frame.destroy()
+        self.update_queue_status()
+
+    def get_video_info(self, url, ydl_opts):
+        # Return a compacted info dict, fetching it only if it isn't cached
+        if url in self.info_cache:
+            return self.info_cache.get(url)
+
+        compact_info = fetch_video_info(url, ydl_opts)
+        self.info_cache.put(url, compact_info)
+        return compact_info
+
     def download_single_video(self, url, format_id, progress):
+        import yt_dlp
+
         download_path = os.path.join(self.location_entry.get(), '%(title)s_%(id)s.%(ext)s')
         ydl_opts = {
             'format': format_id,
@@ -367,11 +525,10 @@ class VideoDownloaderGUI:
         }
         
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                ydl.download([url])
-            except Exception as e:
-                # Re-raise the exception so the download_worker can catch and handle it
-                raise e
+            # With ignoreerrors set, yt-dlp reports failures through the return
+            # code; raise so the download_worker records the failure
+            if ydl.download([url]) != 0:
+                raise Exception("yt-dlp could not download this video")
 
     def progress_hook(self, d, progress):
         if d['status'] == 'downloading':
@@ -390,6 +547,8 @@ class VideoDownloaderGUI:
                 pass
 
     def fetch_formats(self):
+        import yt_dlp
+
         # Disable the button and show loading state
         self.get_formats_button.config(state=tk.DISABLED)
         original_text = self.get_formats_button.cget('text')
@@ -405,7 +564,17 @@ class VideoDownloaderGUI:
         # Use the first URL for initial processing to detect playlist or get single video info
         initial_url = urls[0]
 
-        self.formats = []
+        self.format_options = []
+
+        # A cached single video needs no extraction at all
+        if initial_url in self.info_cache:
+            cached_info = self.get_video_info(initial_url, None)
+            self.format_options = cached_info['format_options']
+            self.show_preview_window(cached_info)
+            self.get_formats_button.config(state=tk.NORMAL)
+            self.get_formats_button.config(text=original_text)
+            return
+
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -456,19 +625,14 @@ class VideoDownloaderGUI:
                                 }
                                 # Use a new YDL instance for the single video detailed info fetch
                                 try:
-                                    with yt_dlp.YoutubeDL(single_video_ydl_opts) as single_ydl:
-                                         first_video_info = single_ydl.extract_info(updated_urls[0], download=False)
-                                    self.formats = first_video_info.get('formats', [])
+                                    first_video_info = self.get_video_info(updated_urls[0], single_video_ydl_opts)
+                                    self.format_options = first_video_info['format_options']
 
                                     # Show preview window for the first video
-                                    self.show_preview_window({
-                                        'title': first_video_info.get('title', 'Unknown'),
-                                        'duration': first_video_info.get('duration', 0),
-                                        'thumbnail': first_video_info.get('thumbnail', '')
-                                    })
+                                    self.show_preview_window(first_video_info)
                                 except Exception as single_video_e:
                                     messagebox.showwarning("Warning", f"Could not retrieve detailed information for the first video in the playlist: {str(single_video_e)}\nOther videos might still be added to the queue if you proceed.")
-                                    # In case of failure to get info for the first video, self.formats will be empty,
+                                    # In case of failure to get info for the first video, self.format_options will be empty,
                                     # but the user might still want to try adding the other videos with default options.
                                     # We can show a basic preview window or allow adding without format selection.
                                     # For now, let's re-enable the button and inform the user.
@@ -486,6 +650,7 @@ class VideoDownloaderGUI:
                     return # Exit the function after handling playlist confirmation
 
                 else: # This handles single videos or types that are not playlists with entries
+                    info = None # Drop the probe result before the detailed fetch
                     # Not a playlist with entries, proceed as with a single video
                     # We need detailed info now, ensure extract_flat is False and ignoreerrors/no_abort_on_error are default (False for single video info)
                     single_video_ydl_opts = {
@@ -495,17 +660,12 @@ class VideoDownloaderGUI:
                         'ignoreerrors': False,
                         'no_abort_on_error': False
                     }
-                    # Re-fetch info for detailed format list using a new YDL instance
-                    with yt_dlp.YoutubeDL(single_video_ydl_opts) as single_ydl:
-                         detailed_info = single_ydl.extract_info(initial_url, download=False)
-                    self.formats = detailed_info.get('formats', [])
+                    # Re-fetch info for detailed format list using a new YDL instance (or the cache)
+                    detailed_info = self.get_video_info(initial_url, single_video_ydl_opts)
+                    self.format_options = detailed_info['format_options']
 
                     # Show preview window for the single video
-                    self.show_preview_window({
-                        'title': detailed_info.get('title', 'Unknown'),
-                        'duration': detailed_info.get('duration', 0),
-                        'thumbnail': detailed_info.get('thumbnail', '')
-                    })
+                    self.show_preview_window(detailed_info)
 
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -538,6 +698,7 @@ class VideoDownloaderGUI:
             widget.destroy()
         
         self.active_downloads.clear()
+        self.completed_downloads.clear()
         self.update_queue_status()
 
     def pause_all(self):
@@ -551,6 +712,7 @@ class VideoDownloaderGUI:
                 download.toggle_pause()
 
     def remove_download(self, download):
+        self.completed_downloads.discard(download.url)
         if download.url in self.active_downloads:
             del self.active_downloads[download.url]
             self.update_queue_status()